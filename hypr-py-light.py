@@ -2,22 +2,44 @@
 import os
 import sys
 import json
+import math
 import time
 import signal
-import configparser
-import requests
+import threading
+import logging
+import logging.handlers
 import subprocess
 from pathlib import Path
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Tuple, Optional, Dict
 
 
+# JSON backend: prefer orjson (fast Rust-backed parser/serializer) when
+# available, fall back to the stdlib. Both loaders accept bytes and both
+# dumpers return bytes, so callers always read/write files in binary mode.
+try:
+    import orjson
+
+    def json_loads(data):
+        return orjson.loads(data)
+
+    def json_dumps(obj, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+except ImportError:
+    def json_loads(data):
+        return json.loads(data)
+
+    def json_dumps(obj, indent: bool = False) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None).encode()
+
+
 # Configuration
 CONFIG_DIR = Path.home() / ".config/hypr-py-light"
 CACHE_DIR = CONFIG_DIR / "cache"
 CONFIG_FILE = CONFIG_DIR / "config.ini"
 STATE_FILE = CONFIG_DIR / "state.json"
 LOG_FILE = CONFIG_DIR / "hyprlight.log"
+LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 
 
 # Temperature presets (Kelvin)
@@ -42,9 +64,47 @@ OWM_API_URL = "https://api.openweathermap.org/data/2.5/weather"
 class ScreenLightManager:
     def __init__(self):
         self.setup_directories()
+        self.setup_logging()
         self.load_config()
         self.load_state()
-        self.hyprsunset_pid = None
+        self.hyprsunset_pid = self.state.get('hyprsunset_pid')
+        self._weather_cache = None  # (timestamp, data) memo within one process
+        self._dbus = None  # lazy DBus connection for notifications
+        self._last_notif_id = 0  # reuse the same bubble for updates
+        self._last_notify_msg = None  # dedupe repeated notifications
+        self._last_notify_ts = 0.0
+        self._wake = threading.Event()  # set by SIGHUP to wake the daemon loop
+        self._sun_cache = {}  # date -> (sunrise, sunset) for _is_night
+        self.session = None  # created lazily by _http_session()
+
+
+    def __del__(self):
+        try:
+            if self.session is not None:
+                self.session.close()
+        except Exception:
+            pass
+
+
+    def _http_session(self):
+        """Create the shared HTTP session on first use.
+
+        Importing requests costs ~30 ms and ~4 MB RSS, so CLI commands that
+        never touch the network (toggle, status with a fresh cache) should
+        not pay for it. One session for both APIs: keep-alive avoids a fresh
+        TCP+TLS handshake on every daemon tick.
+        """
+        if self.session is None:
+            import requests
+            from urllib3.util.retry import Retry
+            self.session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=2,
+                pool_maxsize=2,
+                max_retries=Retry(total=2, backoff_factor=0.3)
+            )
+            self.session.mount('https://', adapter)
+        return self.session
 
 
     def setup_directories(self):
@@ -52,28 +112,71 @@ class ScreenLightManager:
         CACHE_DIR.mkdir(exist_ok=True)
 
 
+    def setup_logging(self):
+        # One long-lived file handle instead of open/append/close per
+        # message; INFO lines batch in memory and flush in one write()
+        # every 64 records, on any ERROR, or at shutdown.
+        self._logger = logging.getLogger('hyprlight')
+        if self._logger.handlers:
+            self._log_handler = self._logger.handlers[0]
+            return
+        file_handler = logging.FileHandler(LOG_FILE)
+        # Explicit datefmt: the formatter timestamps records with a
+        # single C-level time.strftime call and skips the default
+        # format's millisecond suffix handling
+        file_handler.setFormatter(
+            logging.Formatter('[%(asctime)s] %(message)s', datefmt=LOG_DATE_FORMAT))
+        self._log_handler = logging.handlers.MemoryHandler(
+            capacity=64,
+            flushLevel=logging.ERROR,
+            target=file_handler
+        )
+        self._logger.addHandler(self._log_handler)
+        self._logger.setLevel(logging.INFO)
+
+
+    def _flush_logs(self):
+        self._log_handler.flush()
+
+
     def load_config(self):
-        self.config = configparser.ConfigParser()
+        # The config is a two-entry INI file; a hand-rolled parser keeps
+        # configparser (and its import cost) out of CLI start-up while
+        # reading the same on-disk format
+        self._api_keys = {
+            'openweather': '',
+            'ipgeolocation': ''
+        }
         if CONFIG_FILE.exists():
-            self.config.read(CONFIG_FILE)
-        else:
-            self.config['API'] = {
-                'openweather': '',
-                'ipgeolocation': ''
-            }
+            section = None
+            with open(CONFIG_FILE) as f:
+                for line in f:
+                    line = line.strip()
+                    if not line or line.startswith(('#', ';')):
+                        continue
+                    if line.startswith('[') and line.endswith(']'):
+                        section = line[1:-1].strip()
+                    elif section == 'API' and '=' in line:
+                        key, value = line.split('=', 1)
+                        self._api_keys[key.strip()] = value.strip()
+        # Hoist the keys so the fetchers skip the dict lookup on every tick
+        self._owm_key = self._api_keys.get('openweather') or None
+        self._ipgeo_key = self._api_keys.get('ipgeolocation') or None
 
 
     def save_config(self):
         with open(CONFIG_FILE, 'w') as f:
-            self.config.write(f)
+            f.write('[API]\n')
+            for key, value in self._api_keys.items():
+                f.write(f"{key} = {value}\n")
 
 
     def load_state(self):
         try:
-            with open(STATE_FILE) as f:
-                self.state = json.load(f)
+            with open(STATE_FILE, 'rb') as f:
+                self.state = json_loads(f.read())
             self.log(f"State loaded: {self.state}")
-        except (FileNotFoundError, json.JSONDecodeError) as e:
+        except (FileNotFoundError, ValueError) as e:
             self.state = {
                 'manual': False,
                 'bluelight': False,
@@ -81,75 +184,179 @@ class ScreenLightManager:
             }
             self.log(f"State file not found or invalid, using defaults: {self.state}")
         except Exception as e:
-            self.log(f"Error loading state: {str(e)}")
+            self.log(f"Error loading state: {str(e)}", logging.ERROR)
             self.state = {
                 'manual': False,
                 'bluelight': False,
                 'last_temp': 4500
             }
+        self._state_dirty = False
 
 
     def save_state(self):
         try:
-            with open(STATE_FILE, 'w') as f:
-                json.dump(self.state, f, indent=2)
+            # Write to a sibling tempfile and rename: the rename is atomic
+            # on POSIX, so a crash mid-write can never leave a truncated
+            # state file behind
+            tmp_file = STATE_FILE.with_suffix('.json.tmp')
+            with open(tmp_file, 'wb') as f:
+                f.write(json_dumps(self.state, indent=True))
+            os.replace(tmp_file, STATE_FILE)
             self.log(f"State saved: {self.state}")
         except Exception as e:
-            self.log(f"Error saving state: {str(e)}")
+            self.log(f"Error saving state: {str(e)}", logging.ERROR)
+        self._state_dirty = False
+
+
+    def _maybe_save_state(self):
+        """Flush state to disk only if something actually changed.
+
+        Mutations set _state_dirty; public commands call this once at the
+        end so one user action results in at most one write.
+        """
+        if self._state_dirty:
+            self.save_state()
+
+
+    def _dbus_notify(self, message: str) -> bool:
+        """Send a notification straight over DBus, skipping the notify-send
+        fork+exec. Reuses one connection and replaces the previous bubble.
+
+        Returns False when jeepney or the session bus is unavailable so the
+        caller can fall back to notify-send.
+        """
+        try:
+            from jeepney import DBusAddress, new_method_call
+            from jeepney.io.blocking import open_dbus_connection
+        except ImportError:
+            return False
+        try:
+            if self._dbus is None:
+                self._dbus = open_dbus_connection(bus='SESSION')
+            notifications = DBusAddress(
+                '/org/freedesktop/Notifications',
+                bus_name='org.freedesktop.Notifications',
+                interface='org.freedesktop.Notifications'
+            )
+            msg = new_method_call(
+                notifications, 'Notify', 'susssasa{sv}i',
+                ('Screen Lighting', self._last_notif_id, '',
+                 '🌡️ ' + message, '', [], {}, 3000)
+            )
+            reply = self._dbus.send_and_get_reply(msg)
+            self._last_notif_id = reply.body[0]
+            return True
+        except Exception as e:
+            self.log(f"DBus notification error: {str(e)}", logging.ERROR)
+            self._dbus = None
+            return False
 
 
     def notify(self, message: str):
+        self.log(message)
+        # Identical message within the last minute (e.g. the daemon
+        # retrying the same error): log it but skip the notification
+        now = time.monotonic()
+        if message == self._last_notify_msg and now - self._last_notify_ts < 60:
+            return
+        self._last_notify_msg = message
+        self._last_notify_ts = now
+        if self._dbus_notify(message):
+            return
         try:
             subprocess.run(['notify-send', '-a', 'Screen Lighting', '-t', '3000', '🌡️ ' + message])
-            self.log(message)
         except FileNotFoundError:
             pass
 
 
-    def log(self, message: str):
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        with open(LOG_FILE, 'a') as f:
-            f.write(f"[{timestamp}] {message}\n")
+    def log(self, message: str, level: int = logging.INFO):
+        self._logger.log(level, message)
+
+
+    def _read_http_cache(self, cache_file: Path) -> Optional[Dict]:
+        """Read a cached API response of the form {etag, last_modified, body}.
+
+        Older cache files stored the raw body directly; wrap those so callers
+        always see the same shape.
+        """
+        try:
+            if cache_file.exists():
+                with open(cache_file, 'rb') as f:
+                    cached = json_loads(f.read())
+                if isinstance(cached, dict) and 'body' in cached:
+                    return cached
+                return {'etag': None, 'last_modified': None, 'body': cached}
+        except (ValueError, OSError) as e:
+            self.log(f"Error reading cache {cache_file.name}: {str(e)}", logging.ERROR)
+        return None
+
+
+    def _write_http_cache(self, cache_file: Path, response, body: Dict):
+        cached = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'body': body
+        }
+        with open(cache_file, 'wb') as f:
+            f.write(json_dumps(cached))
+
+
+    @staticmethod
+    def _conditional_headers(cached: Optional[Dict]) -> Dict:
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        return headers
 
 
     def get_coordinates(self) -> Tuple[float, float]:
         # Try IP geolocation API first (don't use cache if we want fresh location)
-        api_key = self.config['API'].get('ipgeolocation')
+        api_key = self._ipgeo_key
+        location_cache = CACHE_DIR / "location.json"
         if api_key:
             try:
                 self.log("Attempting to fetch location from IP geolocation API...")
-                response = requests.get(
+                cached = self._read_http_cache(location_cache)
+                response = self._http_session().get(
                     IPGEO_API_URL,
                     params={'apiKey': api_key, 'fields': 'latitude,longitude,city,country_name'},
+                    headers=self._conditional_headers(cached),
                     timeout=10
                 )
+                if response.status_code == 304 and cached:
+                    # Unchanged since last fetch; reuse cached body, no parse
+                    body = cached['body']
+                    return body['lat'], body['lon']
                 response.raise_for_status()
-                data = response.json()
-                
+                # json_loads on the raw bytes: skips response.json()'s full
+                # str decode and uses the faster parser
+                data = json_loads(response.content)
+
                 lat = float(data['latitude'])
                 lon = float(data['longitude'])
-                
+
                 self.log(f"Successfully fetched location: {data.get('city', 'Unknown')}, {data.get('country_name', 'Unknown')} ({lat}, {lon})")
-                
+
                 # Cache coordinates
                 cache_file = CACHE_DIR / "coordinates"
                 with open(cache_file, 'w') as f:
                     f.write(f"{lat} {lon}")
-                
+
                 # Cache location info
-                location_cache = CACHE_DIR / "location.json"
                 location_data = {
                     'city': data.get('city', 'Unknown'),
                     'country': data.get('country_name', 'Unknown'),
                     'lat': lat,
                     'lon': lon
                 }
-                with open(location_cache, 'w') as f:
-                    json.dump(location_data, f)
-                    
+                self._write_http_cache(location_cache, response, location_data)
+
                 return lat, lon
             except Exception as e:
-                self.log(f"Geolocation API error: {str(e)}")
+                self.log(f"Geolocation API error: {str(e)}", logging.ERROR)
         else:
             self.log("No IP geolocation API key configured")
 
@@ -163,7 +370,7 @@ class ScreenLightManager:
                 self.log(f"Using cached coordinates: {lat}, {lon}")
                 return lat, lon
             except Exception as e:
-                self.log(f"Error reading cached coordinates: {str(e)}")
+                self.log(f"Error reading cached coordinates: {str(e)}", logging.ERROR)
 
 
         # Fallback to London coordinates
@@ -175,11 +382,11 @@ class ScreenLightManager:
         """Get cached location information"""
         location_cache = CACHE_DIR / "location.json"
         try:
-            if location_cache.exists():
-                with open(location_cache) as f:
-                    return json.load(f)
+            cached = self._read_http_cache(location_cache)
+            if cached:
+                return cached['body']
         except Exception as e:
-            self.log(f"Error reading location cache: {str(e)}")
+            self.log(f"Error reading location cache: {str(e)}", logging.ERROR)
         
         # Fallback location info
         return {
@@ -188,19 +395,20 @@ class ScreenLightManager:
             'lat': 51.5074,
             'lon': -0.1278
         }
-    def get_weather(self) -> Optional[Dict]:
+    def get_weather(self, coords: Optional[Tuple[float, float]] = None) -> Optional[Dict]:
         cache_file = CACHE_DIR / "weather.json"
+        cached = self._read_http_cache(cache_file)
         try:
-            lat, lon = self.get_coordinates()
-            api_key = self.config['API'].get('openweather')
+            # Callers that already hold coordinates (e.g. the start-up
+            # warm-up) pass them in so this does not trigger its own
+            # geolocation round trip
+            lat, lon = coords if coords else self.get_coordinates()
+            api_key = self._owm_key
             if not api_key:
                 self.log("OpenWeather API key not configured")
-                if cache_file.exists():
-                    with open(cache_file) as f:
-                        return json.load(f)
-                return None
-                
-            response = requests.get(
+                return cached['body'] if cached else None
+
+            response = self._http_session().get(
                 OWM_API_URL,
                 params={
                     'lat': lat,
@@ -208,23 +416,112 @@ class ScreenLightManager:
                     'appid': api_key,
                     'units': 'metric'
                 },
+                headers=self._conditional_headers(cached),
                 timeout=15
             )
-            data = response.json()
-            with open(cache_file, 'w') as f:
-                json.dump(data, f)
+            if response.status_code == 304 and cached:
+                # Unchanged since last fetch; reuse cached body, no parse
+                return cached['body']
+            data = json_loads(response.content)
+            self._write_http_cache(cache_file, response, data)
             return data
         except Exception as e:
-            self.log(f"Weather API error: {str(e)}")
-            if cache_file.exists():
-                with open(cache_file) as f:
-                    return json.load(f)
-            return None
+            self.log(f"Weather API error: {str(e)}", logging.ERROR)
+            return cached['body'] if cached else None
+
+
+    def _cached_weather(self, max_age: int = 300) -> Optional[Dict]:
+        """Return weather data, reusing the on-disk cache while it is fresh.
+
+        Avoids hitting OpenWeather again when the cache file was written
+        within the last `max_age` seconds (e.g. status right after a tick).
+        """
+        now = time.time()
+        if self._weather_cache and now - self._weather_cache[0] < max_age:
+            return self._weather_cache[1]
+
+        cache_file = CACHE_DIR / "weather.json"
+        try:
+            mtime = cache_file.stat().st_mtime
+            if now - mtime < max_age:
+                cached = self._read_http_cache(cache_file)
+                if cached:
+                    self._weather_cache = (mtime, cached['body'])
+                    return cached['body']
+        except OSError:
+            pass
+
+        data = self.get_weather()
+        if data is not None:
+            self._weather_cache = (now, data)
+        return data
+
+
+    def _sun_times(self, lat: float, lon: float, day) -> Optional[Tuple[datetime, datetime]]:
+        """Compute (sunrise, sunset) in UTC for the given date and location.
+
+        Uses the standard NOAA solar position equations: fractional year ->
+        equation of time + solar declination -> hour angle at the official
+        zenith (90.833°, accounting for refraction and the solar disc).
+        Returns None during polar day/night when the sun never crosses the
+        horizon.
+        """
+        day_of_year = day.timetuple().tm_yday
+        gamma = 2 * math.pi / 365 * (day_of_year - 1 + 0.5)
+        eqtime = 229.18 * (0.000075 + 0.001868 * math.cos(gamma)
+                           - 0.032077 * math.sin(gamma)
+                           - 0.014615 * math.cos(2 * gamma)
+                           - 0.040849 * math.sin(2 * gamma))
+        decl = (0.006918 - 0.399912 * math.cos(gamma) + 0.070257 * math.sin(gamma)
+                - 0.006758 * math.cos(2 * gamma) + 0.000907 * math.sin(2 * gamma)
+                - 0.002697 * math.cos(3 * gamma) + 0.00148 * math.sin(3 * gamma))
+        lat_rad = math.radians(lat)
+        cos_ha = (math.cos(math.radians(90.833)) / (math.cos(lat_rad) * math.cos(decl))
+                  - math.tan(lat_rad) * math.tan(decl))
+        if not -1 <= cos_ha <= 1:
+            return None  # polar day or polar night
+        ha = math.degrees(math.acos(cos_ha))
+        sunrise_minutes = 720 - 4 * (lon + ha) - eqtime
+        sunset_minutes = 720 - 4 * (lon - ha) - eqtime
+        midnight = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+        return (midnight + timedelta(minutes=sunrise_minutes),
+                midnight + timedelta(minutes=sunset_minutes))
+
+
+    def _is_night(self, now: Optional[datetime] = None) -> bool:
+        """True when the sun is below the horizon at the cached location."""
+        if now is None:
+            now = datetime.now(timezone.utc)
+        today = now.date()
+        # Away from the prime meridian the daylight window crosses UTC
+        # midnight (Tokyo's day starts around 20:00 UTC the *previous*
+        # date), so it is day if `now` falls inside the window of the
+        # previous, current or next UTC date.
+        location = None
+        saw_window = False
+        for day in (today - timedelta(days=1), today, today + timedelta(days=1)):
+            if day not in self._sun_cache:
+                if location is None:
+                    location = self.get_location_info()
+                self._sun_cache[day] = self._sun_times(location['lat'], location['lon'], day)
+            times = self._sun_cache[day]
+            if times is None:
+                continue  # no horizon crossing on that date
+            saw_window = True
+            sunrise, sunset = times
+            if sunrise <= now <= sunset:
+                return False
+        if not saw_window:
+            # Polar day/night: fall back to the old fixed-hours heuristic
+            return now.hour < 6 or now.hour >= 20
+        # Drop windows older than yesterday so the cache stays small
+        for stale in [day for day in self._sun_cache if day < today - timedelta(days=1)]:
+            del self._sun_cache[stale]
+        return True
 
 
     def calculate_temperature(self) -> int:
-        current_hour = datetime.now(timezone.utc).hour
-        is_night = current_hour < 6 or current_hour >= 20
+        is_night = self._is_night()
 
 
         if self.state['bluelight']:
@@ -233,7 +530,7 @@ class ScreenLightManager:
             pass
 
 
-        weather = self.get_weather()
+        weather = self._cached_weather()
         if not weather:
             return TEMPERATURE_PROFILE['NIGHT_DEFAULT'] if is_night else TEMPERATURE_PROFILE['DAY_CLEAR']
 
@@ -252,13 +549,54 @@ class ScreenLightManager:
             return TEMPERATURE_PROFILE['DAY_CLOUDY']
 
 
-    def apply_temperature(self, temp: int):
-        # Kill all existing hyprsunset processes
+    def _terminate_hyprsunset(self):
+        """Stop the running hyprsunset instance, if any.
+
+        The tracked pid may come from the state file of an earlier run, so
+        before signalling a process that is not our child, check
+        /proc/<pid>/comm to make sure the pid was not recycled by an
+        unrelated process. With no pid to go on (pre-tracking state file,
+        or a recycled pid), fall back to matching by name with pkill.
+        """
+        pid = self.hyprsunset_pid
+        if pid:
+            try:
+                with open(f"/proc/{pid}/comm") as f:
+                    comm = f.read().strip()
+            except OSError:
+                return  # tracked process already exited, nothing to stop
+            if comm == 'hyprsunset':
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except ProcessLookupError:
+                    return  # exited between the comm check and the kill
+                except Exception as e:
+                    self.log(f"Error killing hyprsunset process {pid}: {str(e)}", logging.ERROR)
+                    return
+                try:
+                    os.waitpid(pid, 0)
+                except ChildProcessError:
+                    # Not our child (daemon restarted since spawning it);
+                    # poll /proc briefly until the SIGTERM lands
+                    for _ in range(50):
+                        if not os.path.exists(f"/proc/{pid}"):
+                            break
+                        time.sleep(0.01)
+                return
+            # comm mismatch: the pid was recycled — fall through to pkill
+            # in case an untracked hyprsunset is still running
+
         try:
-            subprocess.run(['pkill', 'hyprsunset'], check=False)
+            subprocess.run(['pkill', '-x', 'hyprsunset'], check=False)
             time.sleep(0.5)  # Give processes time to terminate
         except Exception as e:
-            self.log(f"Error killing hyprsunset processes: {str(e)}")
+            self.log(f"Error killing hyprsunset processes: {str(e)}", logging.ERROR)
+
+
+    def apply_temperature(self, temp: int):
+        # Terminate the previous hyprsunset; with a valid tracked pid this
+        # is a direct signal with no pkill fork and no fixed sleep
+        self._terminate_hyprsunset()
 
 
         # Start new process
@@ -267,15 +605,17 @@ class ScreenLightManager:
                                      stdout=subprocess.DEVNULL, 
                                      stderr=subprocess.DEVNULL)
             self.hyprsunset_pid = process.pid
+            self.state['hyprsunset_pid'] = process.pid
             self.state['last_temp'] = temp
-            self.save_state()
+            self._state_dirty = True
+            self._maybe_save_state()
             self.notify(f"Screen temperature set to {temp}K")
             self.log(f"Started hyprsunset with PID {process.pid}, temp {temp}K")
         except FileNotFoundError:
-            self.log("Error: hyprsunset command not found")
+            self.log("Error: hyprsunset command not found", logging.ERROR)
             self.notify("Error: hyprsunset not installed or not in PATH")
         except Exception as e:
-            self.log(f"Error starting hyprsunset: {str(e)}")
+            self.log(f"Error starting hyprsunset: {str(e)}", logging.ERROR)
             self.notify(f"Error setting temperature: {str(e)}")
 
 
@@ -284,18 +624,18 @@ class ScreenLightManager:
             self.notify("Cannot toggle blue light filter in automatic mode. Switch to manual mode first.")
             return
         self.state['bluelight'] = not self.state['bluelight']
+        self._state_dirty = True
         temp = TEMPERATURE_PROFILE['MANUAL_ON'] if self.state['bluelight'] else TEMPERATURE_PROFILE['MANUAL_OFF']
         self.apply_temperature(temp)
-        self.save_state()
+        self._maybe_save_state()
         status = "ON (5000K)" if self.state['bluelight'] else "OFF (6500K)"
         self.notify(f"Blue light filter toggled {status}")
 
 
     def toggle_manual_mode(self):
         """Toggle between manual and automatic modes"""
-        # Reload state to ensure we have the latest state
-        self.load_state()
-        
+        # State was loaded in __init__ and this process is the sole writer,
+        # so no reload is needed here
         current_mode = "Manual" if self.state['manual'] else "Automatic"
         self.log(f"Current mode before toggle: {current_mode}")
         
@@ -303,7 +643,7 @@ class ScreenLightManager:
             # Switch to automatic mode
             self.state['manual'] = False
             self.state['bluelight'] = False
-            self.save_state()
+            self._state_dirty = True
             self.log("Toggled to automatic mode")
             self.notify("Switched to automatic mode")
             self.update_temperature()  # Apply automatic temperature immediately
@@ -311,11 +651,12 @@ class ScreenLightManager:
             # Switch to manual mode
             self.state['manual'] = True
             self.state['bluelight'] = False  # turn off bluelight filter on manual mode
-            self.save_state()
+            self._state_dirty = True
             self.log("Toggled to manual mode")
             self.apply_temperature(TEMPERATURE_PROFILE['MANUAL_OFF'])  # neutral 6500K
             self.notify("Switched to manual mode - screen set to neutral (6500K)")
-        
+        self._maybe_save_state()
+
         # Log final state
         final_mode = "Manual" if self.state['manual'] else "Automatic"
         self.log(f"Final mode after toggle: {final_mode}")
@@ -326,9 +667,10 @@ class ScreenLightManager:
         if self.state['manual']:
             self.state['manual'] = False
             self.state['bluelight'] = False
-            self.save_state()
+            self._state_dirty = True
             self.notify("Switched to automatic mode")
             self.update_temperature()
+            self._maybe_save_state()
         else:
             self.notify("Already in automatic mode")
 
@@ -338,8 +680,9 @@ class ScreenLightManager:
         if not self.state['manual']:
             self.state['manual'] = True
             self.state['bluelight'] = False  # turn off bluelight filter on manual mode
+            self._state_dirty = True
             self.apply_temperature(TEMPERATURE_PROFILE['MANUAL_OFF'])  # neutral 6500K
-            self.save_state()
+            self._maybe_save_state()
             self.notify("Switched to manual mode - screen set to neutral (6500K)")
         else:
             self.notify("Already in manual mode")
@@ -349,22 +692,21 @@ class ScreenLightManager:
         if not self.state['manual']:
             new_temp = self.calculate_temperature()
             self.log(f"Calculated temperature: {new_temp}K, current: {self.state['last_temp']}K")
-            if new_temp != self.state['last_temp']:
+            # ±50K hysteresis: skip the kill/respawn (and its notification)
+            # for changes too small to notice
+            if abs(new_temp - self.state['last_temp']) >= 50:
                 self.apply_temperature(new_temp)
             else:
                 self.log(f"Temperature unchanged at {new_temp}K")
 
 
     def status(self):
-        # Reload state to ensure we show current state
-        self.load_state()
-        
         # Get location info
         location_info = self.get_location_info()
         location_str = f"{location_info['city']}, {location_info['country']}"
         
-        # Get weather info
-        weather = self.get_weather()
+        # Get weather info (cached copy is fine for a status line)
+        weather = self._cached_weather()
         weather_str = "Unknown"
         temp_str = "Unknown"
         
@@ -379,9 +721,7 @@ class ScreenLightManager:
                 weather_str = "Weather data unavailable"
         
         # Get current time info
-        current_hour = datetime.now(timezone.utc).hour
-        is_night = current_hour < 6 or current_hour >= 20
-        time_period = "Night" if is_night else "Day"
+        time_period = "Night" if self._is_night() else "Day"
         
         # Get current state
         temp = self.state.get('last_temp', 'Unknown')
@@ -415,17 +755,49 @@ class ScreenLightManager:
 
     def run_daemon(self):
         self.notify(f"Starting screen temperature service, initial temp: {self.state.get('last_temp', 'Unknown')}K")
+        # SIGHUP wakes the loop immediately instead of waiting out the
+        # sleep (e.g. after a config change)
+        signal.signal(signal.SIGHUP, lambda signum, frame: self._wake.set())
+
+        # Flush buffered log records before dying on SIGTERM — the usual
+        # way the daemon is stopped, and exactly when the log matters
+        def _on_sigterm(signum, frame):
+            self._flush_logs()
+            sys.exit(0)
+        signal.signal(signal.SIGTERM, _on_sigterm)
+
+        # Warm the location and weather caches concurrently; the weather
+        # fetch runs against the last-cached coordinates so the two round
+        # trips genuinely overlap and start-up pays max(RTT) instead of
+        # the sum. Create the shared session first so the two threads do
+        # not race through _http_session()'s lazy init.
+        from concurrent.futures import ThreadPoolExecutor
+        self._http_session()
+        location = self.get_location_info()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self.get_coordinates),
+                executor.submit(self.get_weather, (location['lat'], location['lon']))
+            ]
+            for future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    self.log(f"Cache warm-up error: {str(e)}", logging.ERROR)
         # Apply initial temperature
         if not self.state['manual']:
             self.update_temperature()
-        
+
         while True:
             try:
                 self.update_temperature()
-                time.sleep(300)  # 5 minutes
+                self._flush_logs()  # one buffered write per tick
+                self._wake.wait(300)  # 5 minutes, or until signalled
+                self._wake.clear()
             except Exception as e:
-                self.log(f"Error in daemon loop: {str(e)}")
-                time.sleep(60)  # Wait 1 minute on error before retrying
+                self.log(f"Error in daemon loop: {str(e)}", logging.ERROR)
+                self._wake.wait(60)  # Wait 1 minute on error before retrying
+                self._wake.clear()
 
 
 def initial_setup():
@@ -433,17 +805,15 @@ def initial_setup():
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 
-    config = configparser.ConfigParser()
-    config['API'] = {}
-
-
     print("Screen Temperature Setup")
-    config['API']['openweather'] = input("Enter OpenWeather API key: ").strip()
-    config['API']['ipgeolocation'] = input("Enter IPGeolocation API key: ").strip()
+    openweather = input("Enter OpenWeather API key: ").strip()
+    ipgeolocation = input("Enter IPGeolocation API key: ").strip()
 
 
     with open(CONFIG_FILE, 'w') as f:
-        config.write(f)
+        f.write('[API]\n')
+        f.write(f"openweather = {openweather}\n")
+        f.write(f"ipgeolocation = {ipgeolocation}\n")
 
 
     print("Configuration saved. Starting service...")